@@ -1,7 +1,9 @@
 """FastAPI dependency injection setup."""
+from dataclasses import dataclass
 from typing import Optional
 
 from backend.repository.clickhouse_client import ClickHouseConnection
+from backend.repository.redis_cache import RedisCache
 from backend.repository.stock_repository import (
     ClickHouseStockPriceRepository,
     ClickHouseHistoricalRepository,
@@ -11,49 +13,66 @@ from backend.services.historical_service import HistoricalService
 from backend.services.alert_service import AlertService
 
 
-# Application state (set during lifespan)
-_connection: Optional[ClickHouseConnection] = None
-_stock_service: Optional[StockService] = None
-_historical_service: Optional[HistoricalService] = None
-_alert_service: Optional[AlertService] = None
+@dataclass(slots=True)
+class AppState:
+    """Container for process-wide singletons (set during lifespan).
+
+    A single slotted object keeps the per-request dependency lookups to
+    one attribute access plus one readiness check.
+    """
+    connection: Optional[ClickHouseConnection] = None
+    cache: Optional[RedisCache] = None
+    stock_service: Optional[StockService] = None
+    historical_service: Optional[HistoricalService] = None
+    alert_service: Optional[AlertService] = None
+    ready: bool = False
+
+
+state = AppState()
 
 
 def init_services(connection: ClickHouseConnection) -> None:
     """Initialize all services with connection."""
-    global _connection, _stock_service, _historical_service, _alert_service
-    _connection = connection
+    state.connection = connection
+    state.cache = RedisCache()
 
     stock_repo = ClickHouseStockPriceRepository(connection)
     historical_repo = ClickHouseHistoricalRepository(connection)
 
-    _stock_service = StockService(stock_repo)
-    _historical_service = HistoricalService(historical_repo)
-    _alert_service = AlertService(threshold=-5.0)
+    state.stock_service = StockService(stock_repo, cache=state.cache)
+    state.historical_service = HistoricalService(historical_repo, cache=state.cache)
+    state.alert_service = AlertService(threshold=-5.0)
+    state.ready = True
 
 
 def get_connection() -> ClickHouseConnection:
     """Get database connection."""
-    if _connection is None:
+    if not state.ready:
         raise RuntimeError("Services not initialized")
-    return _connection
+    return state.connection
+
+
+def get_cache() -> Optional[RedisCache]:
+    """Get Redis cache (may be None before startup)."""
+    return state.cache
 
 
 def get_stock_service() -> StockService:
     """Get stock service dependency."""
-    if _stock_service is None:
+    if not state.ready:
         raise RuntimeError("Services not initialized")
-    return _stock_service
+    return state.stock_service
 
 
 def get_historical_service() -> HistoricalService:
     """Get historical service dependency."""
-    if _historical_service is None:
+    if not state.ready:
         raise RuntimeError("Services not initialized")
-    return _historical_service
+    return state.historical_service
 
 
 def get_alert_service() -> AlertService:
     """Get alert service dependency."""
-    if _alert_service is None:
+    if not state.ready:
         raise RuntimeError("Services not initialized")
-    return _alert_service
+    return state.alert_service
@@ -1,30 +1,48 @@
 """Health check endpoint."""
 import asyncio
+import time
 from datetime import datetime
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
-from backend.api.schemas import HealthResponse
+import orjson
 
 router = APIRouter()
 
 # These will be set by main.py
 message_queue: asyncio.Queue = None
 connection_manager = None
+db_connection = None
+redis_cache = None
 
+# Probes hit this endpoint every second; reuse the serialized body within
+# the same wall-clock second so repeated probes cost one bytes lookup.
+_cached_second: int = -1
+_cached_body: bytes = b""
 
-def set_health_dependencies(queue: asyncio.Queue, manager) -> None:
+
+def set_health_dependencies(queue: asyncio.Queue, manager, connection=None, cache=None) -> None:
     """Set dependencies for health endpoint."""
-    global message_queue, connection_manager
+    global message_queue, connection_manager, db_connection, redis_cache
     message_queue = queue
     connection_manager = manager
+    db_connection = connection
+    redis_cache = cache
 
 
-@router.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
+@router.get("/health")
+async def health_check() -> Response:
     """Health check endpoint."""
-    return HealthResponse(
-        status="healthy",
-        timestamp=datetime.now().isoformat(),
-        queue_size=message_queue.qsize() if message_queue else 0,
-        websocket_clients=len(connection_manager.active_connections) if connection_manager else 0,
-    )
+    global _cached_second, _cached_body
+    now = int(time.time())
+    if now != _cached_second:
+        _cached_second = now
+        _cached_body = orjson.dumps({
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "queue_size": message_queue.qsize() if message_queue else 0,
+            "websocket_clients": len(connection_manager.active_connections)
+            if connection_manager else 0,
+            "db_pool": db_connection.get_stats() if db_connection else None,
+            "cache": redis_cache.get_stats() if redis_cache else None,
+        })
+    return Response(content=_cached_body, media_type="application/json")
@@ -1,8 +1,9 @@
 """Historical data endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 import logging
 
-from backend.api.schemas import HistoricalDataListResponse, HistoricalDataResponse
+import msgspec
+
 from backend.api.dependencies import get_historical_service
 from backend.services.historical_service import HistoricalService
 
@@ -10,34 +11,48 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["history"])
 
 
-@router.get("/history", response_model=HistoricalDataListResponse)
+@router.get("/history/summary")
+async def get_history_summary(
+    symbol: str,
+    start: str,
+    end: str,
+    service: HistoricalService = Depends(get_historical_service)
+) -> Response:
+    """Get aggregated OHLC stats for a symbol over a date range."""
+    try:
+        symbol = symbol.upper()
+        summary = await service.get_summary(symbol, start, end)
+        if summary is None:
+            raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
+        return Response(content=msgspec.json.encode(summary), media_type="application/json")
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting history summary for {symbol}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/history")
 async def get_history(
     symbol: str,
     start: str,
     end: str,
     service: HistoricalService = Depends(get_historical_service)
-) -> HistoricalDataListResponse:
+) -> Response:
     """Get historical OHLCV data for a symbol."""
     try:
-        data = service.get_historical_data(symbol, start, end)
-        return HistoricalDataListResponse(
-            symbol=symbol.upper(),
-            start_date=start,
-            end_date=end,
-            records=[
-                HistoricalDataResponse(
-                    date=str(d.date),
-                    symbol=d.symbol,
-                    open=d.open,
-                    high=d.high,
-                    low=d.low,
-                    close=d.close,
-                    volume=d.volume,
-                )
-                for d in data
-            ],
-            count=len(data),
-        )
+        symbol = symbol.upper()
+        data = await service.get_historical_data(symbol, start, end)
+        # msgspec encodes the structs straight to JSON bytes, keeping the
+        # hot list path free of per-row Pydantic construction.
+        payload = {
+            "symbol": symbol,
+            "start_date": start,
+            "end_date": end,
+            "records": data,
+            "count": len(data),
+        }
+        return Response(content=msgspec.json.encode(payload), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting history for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,8 +1,9 @@
 """Stock price endpoints."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 import logging
 
-from backend.api.schemas import StockPriceResponse, RecentPricesResponse
+import msgspec
+
 from backend.api.dependencies import get_stock_service
 from backend.services.stock_service import StockService
 
@@ -10,23 +11,33 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["stocks"])
 
 
-@router.get("/stocks/{symbol}", response_model=StockPriceResponse)
+@router.get("/stocks")
+async def get_stocks(
+    symbols: str,
+    service: StockService = Depends(get_stock_service)
+) -> Response:
+    """Get latest prices for a comma-separated list of symbols."""
+    try:
+        requested = [s for s in symbols.split(",") if s]
+        prices = await service.get_latest_prices(requested)
+        payload = {price.symbol: price for price in prices}
+        return Response(content=msgspec.json.encode(payload), media_type="application/json")
+    except Exception as e:
+        logger.error(f"Error getting stocks {symbols}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/stocks/{symbol}")
 async def get_stock(
     symbol: str,
     service: StockService = Depends(get_stock_service)
-) -> StockPriceResponse:
+) -> Response:
     """Get latest price for a symbol."""
     try:
-        price = service.get_latest_price(symbol)
+        price = await service.get_latest_price(symbol)
         if not price:
             raise HTTPException(status_code=404, detail=f"No data found for {symbol}")
-        return StockPriceResponse(
-            timestamp=price.timestamp,
-            symbol=price.symbol,
-            price=price.price,
-            volume=price.volume,
-            change_percent=price.change_percent,
-        )
+        return Response(content=msgspec.json.encode(price), media_type="application/json")
     except HTTPException:
         raise
     except Exception as e:
@@ -34,29 +45,31 @@ async def get_stock(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/stocks/{symbol}/recent", response_model=RecentPricesResponse)
+@router.get("/stocks/{symbol}/recent")
 async def get_recent_prices(
     symbol: str,
     limit: int = 100,
+    order: str = "desc",
     service: StockService = Depends(get_stock_service)
-) -> RecentPricesResponse:
-    """Get recent price history for a symbol."""
+) -> Response:
+    """Get recent price history for a symbol.
+
+    order=asc returns rows oldest-first so charting clients can skip
+    their own sort pass.
+    """
     try:
-        prices = service.get_recent_prices(symbol, limit)
-        return RecentPricesResponse(
-            symbol=symbol.upper(),
-            records=[
-                StockPriceResponse(
-                    timestamp=p.timestamp,
-                    symbol=p.symbol,
-                    price=p.price,
-                    volume=p.volume,
-                    change_percent=p.change_percent,
-                )
-                for p in prices
-            ],
-            count=len(prices),
-        )
+        symbol = symbol.upper()
+        prices = await service.get_recent_prices(symbol, limit)
+        if order == "asc":
+            prices = prices[::-1]
+        # msgspec encodes the structs straight to JSON bytes, keeping the
+        # hot list path free of per-row Pydantic construction.
+        payload = {
+            "symbol": symbol,
+            "records": prices,
+            "count": len(prices),
+        }
+        return Response(content=msgspec.json.encode(payload), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting recent prices for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1,12 +1,17 @@
 """API request/response schemas (DTOs)."""
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+# Response models are built once and serialized; frozen instances skip
+# __dict__ mutation hooks and unknown fields are dropped instead of kept.
+RESPONSE_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 # Response models
 class StockPriceResponse(BaseModel):
     """Response for single stock price."""
+    model_config = RESPONSE_CONFIG
     timestamp: datetime
     symbol: str
     price: float
@@ -16,6 +21,7 @@ class StockPriceResponse(BaseModel):
 
 class HistoricalDataResponse(BaseModel):
     """Response for single historical record."""
+    model_config = RESPONSE_CONFIG
     date: str
     symbol: str
     open: float
@@ -27,6 +33,7 @@ class HistoricalDataResponse(BaseModel):
 
 class HistoricalDataListResponse(BaseModel):
     """Response for historical data list."""
+    model_config = RESPONSE_CONFIG
     symbol: str
     start_date: str
     end_date: str
@@ -36,6 +43,7 @@ class HistoricalDataListResponse(BaseModel):
 
 class RecentPricesResponse(BaseModel):
     """Response for recent price history."""
+    model_config = RESPONSE_CONFIG
     symbol: str
     records: List[StockPriceResponse]
     count: int
@@ -43,14 +51,18 @@ class RecentPricesResponse(BaseModel):
 
 class HealthResponse(BaseModel):
     """Health check response."""
+    model_config = RESPONSE_CONFIG
     status: str
     timestamp: str
     queue_size: int
     websocket_clients: int
+    db_pool: Optional[dict] = None
+    cache: Optional[dict] = None
 
 
 class AlertResponse(BaseModel):
     """Alert event response."""
+    model_config = RESPONSE_CONFIG
     type: str
     symbol: str
     price: float
@@ -1,40 +1,176 @@
 """WebSocket endpoint for real-time updates."""
-from typing import List, Set
+import asyncio
+from typing import Dict, Optional, Set, Union
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from pydantic import BaseModel
 import logging
 
+import orjson
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+# Frames buffered per client before it is considered too slow to keep.
+OUTBOX_SIZE = 256
+
+# Dropped frames tolerated (outbox full) before a client is disconnected.
+MAX_DROPS = 50
+
+# Price updates are coalesced into one frame per flush interval (or when
+# the pending batch hits MAX_PENDING) to amortize framing overhead.
+FLUSH_INTERVAL = 0.02
+MAX_PENDING = 64
+
+
 class ConnectionManager:
-    """Manage WebSocket connections for broadcasting."""
+    """Manage WebSocket connections for broadcasting.
+
+    Each client gets a bounded outbox queue drained by its own writer
+    task, so the ingest path never awaits a client socket: broadcast is
+    a put_nowait per client, and a client that can't keep up gets
+    dropped instead of stalling the rest.
+    """
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # A set gives O(1) add/discard under connection churn.
+        self.active_connections: Set[WebSocket] = set()
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
+        self._pending: list = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._drops: Dict[WebSocket, int] = {}
+        # Slow-consumer stats, reported via /health.
+        self.frames_dropped = 0
+        self.slow_clients_dropped = 0
+
+    def start(self) -> None:
+        """Start the background flush loop (called from app lifespan)."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    def stop(self) -> None:
+        """Stop the flush loop and send any buffered updates."""
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush_pending()
+
+    @staticmethod
+    def _raise_write_buffer(websocket: WebSocket) -> None:
+        """Lift the transport write buffer so bursts don't force a drain
+        every few frames.
+
+        Transport access is ASGI-server specific, so this is best-effort:
+        on uvicorn the send callable is bound to the protocol that owns
+        the transport.
+        """
+        try:
+            protocol = getattr(websocket._send, "__self__", None)
+            transport = getattr(protocol, "transport", None)
+            if transport is not None:
+                transport.set_write_buffer_limits(high=1024 * 1024, low=256 * 1024)
+        except Exception as e:
+            logger.debug(f"Could not raise WS write buffer limits: {e}")
 
     async def connect(self, websocket: WebSocket) -> None:
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self._raise_write_buffer(websocket)
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self.active_connections.add(websocket)
+        self._outboxes[websocket] = outbox
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, outbox))
         logger.info(f"WebSocket connected. Total: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket) -> None:
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+        self._outboxes.pop(websocket, None)
+        self._drops.pop(websocket, None)
+        writer = self._writers.pop(websocket, None)
+        if writer:
+            writer.cancel()
         logger.info(f"WebSocket disconnected. Total: {len(self.active_connections)}")
 
-    async def broadcast(self, message: dict) -> None:
-        """Broadcast message to all connected clients."""
-        for connection in self.active_connections:
+    async def _writer(self, websocket: WebSocket, outbox: asyncio.Queue) -> None:
+        """Drain one client's outbox onto its socket."""
+        try:
+            while True:
+                payload = await outbox.get()
+                await websocket.send_bytes(payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error writing to WebSocket client: {e}")
+            self.disconnect(websocket)
+
+    def _fanout(self, payload: bytes) -> None:
+        """Enqueue a serialized frame to every client without awaiting.
+
+        A full outbox drops the frame for that client; a client that
+        keeps falling behind is closed with 1013 (try again later).
+        """
+        for websocket, outbox in list(self._outboxes.items()):
             try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting: {e}")
+                outbox.put_nowait(payload)
+            except asyncio.QueueFull:
+                self.frames_dropped += 1
+                drops = self._drops.get(websocket, 0) + 1
+                self._drops[websocket] = drops
+                if drops > MAX_DROPS:
+                    logger.warning(
+                        f"Disconnecting slow WebSocket client after {drops} dropped frames"
+                    )
+                    self.slow_clients_dropped += 1
+                    asyncio.ensure_future(websocket.close(code=1013))
+                    self.disconnect(websocket)
+
+    def get_stats(self) -> dict:
+        """Connection and slow-consumer stats for health reporting."""
+        return {
+            "clients": len(self.active_connections),
+            "frames_dropped": self.frames_dropped,
+            "slow_clients_dropped": self.slow_clients_dropped,
+        }
+
+    async def broadcast(self, message: Union[BaseModel, dict]) -> None:
+        """Broadcast a message (e.g. an alert) to all clients immediately.
+
+        The payload is serialized once; fan-out is a non-blocking enqueue
+        per client. Clients whose outbox is full are dropped.
+        """
+        if not self._outboxes:
+            return
+        if isinstance(message, BaseModel):
+            payload = message.model_dump_json(exclude_none=True, by_alias=True).encode()
+        else:
+            payload = orjson.dumps(message)
+        self._fanout(payload)
+
+    def broadcast_price_update(self, data: dict) -> None:
+        """Queue a price tick for the next coalesced price_updates frame."""
+        self._pending.append(data)
+        if len(self._pending) >= MAX_PENDING:
+            self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        payload = orjson.dumps({"type": "price_updates", "data": self._pending})
+        self._pending = []
+        self._fanout(payload)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            self._flush_pending()
 
 
 # Singleton manager
 manager = ConnectionManager()
 
+# Pre-serialized pong frame for the keepalive reply.
+_PONG = orjson.dumps({"type": "pong"})
+
 
 @router.websocket("/ws/realtime")
 async def websocket_endpoint(websocket: WebSocket) -> None:
@@ -43,7 +179,7 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     try:
         while True:
             data = await websocket.receive_text()
-            await websocket.send_json({"type": "pong"})
+            await websocket.send_bytes(_PONG)
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception as e:
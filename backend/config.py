@@ -15,6 +15,14 @@ class ClickHouseConfig:
     DATABASE: str = os.getenv("CLICKHOUSE_DB", "breadboard")
     USER: str = os.getenv("CLICKHOUSE_USER", "default")
     PASSWORD: str = os.getenv("CLICKHOUSE_PASSWORD", "")
+    POOL_SIZE: int = int(os.getenv("CLICKHOUSE_POOL_SIZE", "20"))
+
+
+class RedisConfig:
+    """Redis cache configuration."""
+    HOST: str = os.getenv("REDIS_HOST", "localhost")
+    PORT: int = int(os.getenv("REDIS_PORT", "6379"))
+    DB: int = int(os.getenv("REDIS_DB", "0"))
 
 
 class AppConfig:
@@ -25,4 +33,5 @@ class AppConfig:
 
 # Singleton instances
 clickhouse_config = ClickHouseConfig()
+redis_config = RedisConfig()
 app_config = AppConfig()
@@ -1,6 +1,8 @@
 """Domain entities - core business objects."""
 from datetime import datetime, date
 from typing import Optional
+
+import msgspec
 from pydantic import BaseModel, Field
 
 
@@ -31,6 +33,40 @@ class HistoricalData(BaseModel):
         populate_by_name = True
 
 
+class StockPriceStruct(msgspec.Struct):
+    """Read-path stock price row.
+
+    msgspec.Struct encodes to JSON several times faster than Pydantic,
+    which dominates the cost of the list endpoints. Field order matches
+    the SELECT column order so rows can be built positionally.
+    """
+    timestamp: datetime
+    symbol: str
+    price: float
+    volume: int = 0
+    change_percent: float = 0.0
+
+
+class HistoricalRowStruct(msgspec.Struct):
+    """Read-path historical OHLCV row."""
+    date: date
+    symbol: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: int
+
+
+class HistoricalSummaryStruct(msgspec.Struct):
+    """Aggregated OHLC summary for a date range, computed in ClickHouse."""
+    open: float
+    close: float
+    high: float
+    low: float
+    days: int
+
+
 class Alert(BaseModel):
     """Price alert entity."""
     type: str = "price_drop"
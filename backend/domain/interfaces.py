@@ -2,19 +2,27 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from backend.domain.entities import StockPrice, HistoricalData, StockPriceCreate, HistoricalDataCreate
+from backend.domain.entities import (
+    StockPriceStruct, HistoricalRowStruct, HistoricalSummaryStruct,
+    StockPriceCreate, HistoricalDataCreate,
+)
 
 
 class StockPriceRepository(ABC):
     """Interface for stock price data access."""
 
     @abstractmethod
-    def get_latest(self, symbol: str) -> Optional[StockPrice]:
+    def get_latest(self, symbol: str) -> Optional[StockPriceStruct]:
         """Get latest price for a symbol."""
         pass
 
     @abstractmethod
-    def get_history(self, symbol: str, limit: int = 100) -> List[StockPrice]:
+    def get_latest_many(self, symbols: List[str]) -> List[StockPriceStruct]:
+        """Get latest prices for several symbols in one query."""
+        pass
+
+    @abstractmethod
+    def get_history(self, symbol: str, limit: int = 100) -> List[StockPriceStruct]:
         """Get recent price history for a symbol."""
         pass
 
@@ -28,6 +36,12 @@ class StockPriceRepository(ABC):
         """Insert multiple stock price records."""
         pass
 
+    @abstractmethod
+    def insert_columns(self, columns: List[list]) -> None:
+        """Insert stock prices from column arrays (timestamp, symbol,
+        price, volume, change_percent)."""
+        pass
+
 
 class HistoricalDataRepository(ABC):
     """Interface for historical OHLCV data access."""
@@ -35,10 +49,17 @@ class HistoricalDataRepository(ABC):
     @abstractmethod
     def get_by_date_range(
         self, symbol: str, start_date: str, end_date: str
-    ) -> List[HistoricalData]:
+    ) -> List[HistoricalRowStruct]:
         """Get historical data for a symbol in date range."""
         pass
 
+    @abstractmethod
+    def get_summary(
+        self, symbol: str, start_date: str, end_date: str
+    ) -> Optional[HistoricalSummaryStruct]:
+        """Get aggregated OHLC stats for a symbol in date range."""
+        pass
+
     @abstractmethod
     def insert(self, record: HistoricalDataCreate) -> None:
         """Insert a single historical record."""
@@ -1,10 +1,11 @@
 """Airflow tasks for historical data fetching."""
 from typing import List
+import asyncio
 import logging
 import os
 
 from backend.infrastructure import yahoo_websocket_client
-from backend.api.dependencies import get_historical_service, init_services, _historical_service
+from backend.api.dependencies import get_historical_service, init_services, state
 from backend.domain.entities import HistoricalDataCreate
 from backend.repository.clickhouse_client import ClickHouseConnection
 
@@ -17,15 +18,24 @@ DEFAULT_SYMBOLS = [
     "ETH-USD", "SOL-USD", "AMD", "NFLX", "COIN",
 ]
 
+# Concurrent Yahoo fetches per batch (also the batch size)
+FETCH_CONCURRENCY = 5
+
+# PID that initialized the services; forked Airflow workers must not
+# reuse sockets opened in the parent process.
+_init_pid: int = None
+
 
 def _ensure_services_initialized() -> None:
     """Initialize services if not already done (for Airflow context).
 
     In FastAPI, services are initialized during app startup via lifespan.
-    In Airflow, tasks run outside app context, so we initialize on first call.
+    In Airflow, tasks run outside app context, so we initialize once per
+    worker process (keyed on PID so forked workers get fresh sockets).
     Uses environment variables for ClickHouse connection config.
     """
-    if _historical_service is None:
+    global _init_pid
+    if not state.ready or _init_pid != os.getpid():
         logger.info("Initializing services for Airflow context...")
         try:
             connection = ClickHouseConnection(
@@ -37,6 +47,7 @@ def _ensure_services_initialized() -> None:
             )
             connection.connect()
             init_services(connection)
+            _init_pid = os.getpid()
             logger.info("Services initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize services: {e}")
@@ -48,7 +59,12 @@ def fetch_symbol_historical_data(symbol: str, period: str = "1d") -> dict:
     _ensure_services_initialized()
     try:
         logger.info(f"Fetching historical data for {symbol} (period: {period})...")
-        data = yahoo_websocket_client.get_historical_data(symbol, period=period)
+        # Bypass the disk cache: this DAG runs every 6 hours precisely to
+        # refresh the current day's bar, and a 24h-TTL cache hit would
+        # re-insert stale rows (and make the Redis invalidation moot).
+        data = yahoo_websocket_client.get_historical_data(
+            symbol, period=period, use_cache=False
+        )
 
         if data and data.get("records"):
             service = get_historical_service()
@@ -87,6 +103,34 @@ def fetch_symbol_historical_data(symbol: str, period: str = "1d") -> dict:
         }
 
 
+async def _fetch_symbols_async(symbols: List[str], period: str) -> List[dict]:
+    """Fetch symbols in batches with bounded concurrency.
+
+    The blocking Yahoo fetch runs in threads via asyncio.to_thread; a
+    semaphore caps in-flight requests and a short pause between batches
+    keeps us under Yahoo rate limits.
+    """
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch(symbol: str) -> dict:
+        async with semaphore:
+            return await asyncio.to_thread(fetch_symbol_historical_data, symbol, period)
+
+    results: List[dict] = []
+    for i in range(0, len(symbols), FETCH_CONCURRENCY):
+        chunk = symbols[i:i + FETCH_CONCURRENCY]
+        results.extend(await asyncio.gather(*(fetch(s) for s in chunk)))
+        if i + FETCH_CONCURRENCY < len(symbols):
+            await asyncio.sleep(1)
+
+    # Fresh rows make cached /history responses stale; drop them.
+    service = get_historical_service()
+    for result in results:
+        if result.get("status") == "success":
+            await service.invalidate_history(result["symbol"])
+    return results
+
+
 def fetch_all_symbols_historical_data(symbols: List[str] = None, period: str = "1d") -> dict:
     """Fetch historical data for all symbols."""
     _ensure_services_initialized()
@@ -94,11 +138,10 @@ def fetch_all_symbols_historical_data(symbols: List[str] = None, period: str = "
         symbols = DEFAULT_SYMBOLS
 
     logger.info(f"Starting historical data fetch for {len(symbols)} symbols...")
-    results = []
+    results = asyncio.run(_fetch_symbols_async(symbols, period))
 
-    for symbol in symbols:
-        result = fetch_symbol_historical_data(symbol, period)
-        results.append(result)
+    # Write out whatever the micro-batch buffer still holds.
+    get_historical_service().flush()
 
     logger.info("Historical data fetch completed")
     return {
@@ -1,9 +1,11 @@
 """Yahoo Finance WebSocket client."""
 import asyncio
-import json
 import logging
+import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Callable, Optional
 
+import orjson
 import websockets
 from backend.infrastructure import yahoo_websocket_client
 
@@ -24,34 +26,55 @@ class YahooWebSocketClient:
         self._broadcast = broadcast_callback
         self._url = "wss://streamer.finance.yahoo.com/"
         self._headers = {"Origin": "https://finance.yahoo.com"}
+        # Protobuf decoding is CPU-bound; run it off the event loop so
+        # receive and broadcast can overlap.
+        self._decoder = ThreadPoolExecutor(max_workers=2, thread_name_prefix="yahoo-decode")
 
     async def run(self) -> None:
-        """Main connection loop with reconnection."""
+        """Main connection loop with reconnection.
+
+        Reconnects with capped exponential backoff plus jitter: transient
+        failures retry after ~1s instead of a fixed 5s, while a real
+        outage backs off to 60s without synchronized reconnect storms.
+        """
+        loop = asyncio.get_running_loop()
+        backoff = 1.0
         while True:
             try:
+                # Yahoo sends small base64'd protobuf frames: deflate
+                # negotiation buys nothing and costs CPU per message, so
+                # compression is off; frame/queue limits are kept modest.
                 async with websockets.connect(
-                    self._url, additional_headers=self._headers
+                    self._url,
+                    additional_headers=self._headers,
+                    compression=None,
+                    max_size=2**20,
+                    max_queue=1024,
                 ) as ws:
                     logger.info("Connected to Yahoo Finance WebSocket")
-                    await ws.send(json.dumps({"subscribe": self._symbols}))
+                    backoff = 1.0
+                    await ws.send(orjson.dumps({"subscribe": self._symbols}).decode())
                     logger.info(f"Subscribed to {len(self._symbols)} symbols")
 
                     async for message in ws:
                         try:
-                            decoded = yahoo_websocket_client.decode_message(message)
+                            decoded = await loop.run_in_executor(
+                                self._decoder, yahoo_websocket_client.decode_message, message
+                            )
                             if decoded:
                                 try:
                                     self._queue.put_nowait(decoded)
                                 except asyncio.QueueFull:
                                     logger.warning("Queue full, dropping message")
-                                await self._broadcast({
-                                    "type": "price_update",
-                                    "data": decoded,
-                                })
+                                # Non-blocking: ticks are coalesced into
+                                # batched frames by the connection manager.
+                                self._broadcast(decoded)
                         except Exception as e:
                             logger.error(f"Error processing message: {e}")
 
             except Exception as e:
+                delay = backoff + random.random()
                 logger.error(f"Yahoo WebSocket error: {e}")
-                logger.info("Reconnecting in 5 seconds...")
-                await asyncio.sleep(5)
+                logger.info(f"Reconnecting in {delay:.1f} seconds...")
+                await asyncio.sleep(delay)
+                backoff = min(backoff * 2, 60)
@@ -1,17 +1,29 @@
 import asyncio
+import time
+from array import array
+from operator import itemgetter
 from typing import Dict, Any, Optional
 from datetime import datetime
 import logging
 
-from backend.domain.entities import StockPriceCreate
 from backend.services.stock_service import StockService
 from backend.services.alert_service import AlertService
 
 logger = logging.getLogger(__name__)
 
+# Single C-level lookup for the fixed message shape; the per-field
+# .get() fallback only runs for messages missing a key.
+_extract = itemgetter("id", "price", "volume", "change_percent", "time")
+
 
 class StreamProcessor:
-    """Process stock price messages with dependency injection."""
+    """Process stock price messages with dependency injection.
+
+    Ticks accumulate in struct-of-arrays buffers (parallel scalar
+    arrays) rather than a list of model objects; records are only
+    materialized once per flush, so the per-message path is a handful
+    of scalar appends.
+    """
 
     def __init__(
         self,
@@ -26,30 +38,53 @@ class StreamProcessor:
         self._alert_service = alert_service
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
-        self.batch: list[StockPriceCreate] = []
+        self._reset_buffers()
         self.is_running = False
 
+    def _reset_buffers(self) -> None:
+        self._ts_ms = array("q")
+        self._symbols: list[str] = []
+        self._prices = array("d")
+        self._volumes = array("q")
+        self._changes = array("d")
+
+    def _clear_buffers(self) -> None:
+        """Empty the buffers in place instead of rebinding new ones."""
+        del self._ts_ms[:]
+        self._symbols.clear()
+        del self._prices[:]
+        del self._volumes[:]
+        del self._changes[:]
+
+    @property
+    def batch_len(self) -> int:
+        return len(self._symbols)
+
     async def _process_message(self, message: Dict[str, Any]) -> None:
         """Process a single message and check for alerts."""
         try:
-            symbol = message.get("id", "UNKNOWN")
-            price = float(message.get("price", 0.0))
-            volume = int(message.get("volume", 0))
-            change_percent = float(message.get("change_percent", 0.0))
-            timestamp_ms = message.get("time", str(int(datetime.now().timestamp() * 1000)))
-            timestamp = datetime.fromtimestamp(int(timestamp_ms) / 1000)
-
-            record = StockPriceCreate(
-                timestamp=timestamp,
-                symbol=symbol,
-                price=price,
-                volume=volume,
-                change_percent=change_percent,
-            )
-            self.batch.append(record)
+            try:
+                symbol, price, volume, change_percent, timestamp_ms = _extract(message)
+            except KeyError:
+                symbol = message.get("id", "UNKNOWN")
+                price = message.get("price", 0.0)
+                volume = message.get("volume", 0)
+                change_percent = message.get("change_percent", 0.0)
+                timestamp_ms = message.get("time") or time.time_ns() // 1_000_000
+            price = float(price)
+            volume = int(volume)
+            change_percent = float(change_percent)
+            timestamp_ms = int(timestamp_ms)
+
+            self._ts_ms.append(timestamp_ms)
+            self._symbols.append(symbol)
+            self._prices.append(price)
+            self._volumes.append(volume)
+            self._changes.append(change_percent)
 
             # Check alert condition
             if self._alert_service.check_alert_condition(symbol, price, change_percent):
+                timestamp = datetime.fromtimestamp(timestamp_ms / 1000)
                 alert = self._alert_service.create_alert(symbol, price, change_percent, timestamp)
                 logger.warning(f"ALERT: {symbol} dropped {change_percent:.2f}% to ${price:.2f}")
                 await self._alert_service.trigger_alert(alert)
@@ -59,13 +94,28 @@ class StreamProcessor:
 
     async def _flush_batch(self) -> None:
         """Write accumulated batch to database via service."""
-        if not self.batch:
+        if not self._symbols:
             return
 
         try:
-            self._stock_service.save_prices(self.batch)
-            logger.debug(f"Flushed {len(self.batch)} records")
-            self.batch = []
+            count = len(self._symbols)
+            # The driver accepts raw unix-second ints for DateTime
+            # columns, so ms -> s is integer math; no datetime objects
+            # are built for the insert.
+            # Columns are copied out so the buffers can be cleared in
+            # place before awaiting: messages processed during the
+            # insert land in the emptied buffers, not the batch being
+            # written.
+            columns = [
+                [ts // 1000 for ts in self._ts_ms],
+                self._symbols[:],
+                list(self._prices),
+                list(self._volumes),
+                list(self._changes),
+            ]
+            self._clear_buffers()
+            await self._stock_service.asave_price_columns(columns)
+            logger.debug(f"Flushed {count} records")
         except Exception as e:
             logger.error(f"Error flushing batch: {e}")
 
@@ -74,23 +124,33 @@ class StreamProcessor:
         self.is_running = True
         logger.info("Stream processor started")
 
-        last_flush = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        monotonic = loop.time  # bound method, one lookup for the whole loop
+        last_flush = monotonic()
 
         while self.is_running:
             try:
-                # Wait for message with timeout
-                try:
-                    message = await asyncio.wait_for(
-                        self.queue.get(), timeout=self.batch_timeout
-                    )
+                # Drain the queue greedily; a timeout is only armed when
+                # the queue is actually empty, so a busy stream pays no
+                # per-message timer setup/teardown.
+                while self.batch_len < self.batch_size:
+                    try:
+                        message = self.queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        remaining = self.batch_timeout - (monotonic() - last_flush)
+                        if remaining <= 0:
+                            break
+                        try:
+                            message = await asyncio.wait_for(
+                                self.queue.get(), timeout=remaining
+                            )
+                        except asyncio.TimeoutError:
+                            break
                     await self._process_message(message)
-                    self.queue.task_done()
-                except asyncio.TimeoutError:
-                    pass  # No message, will check batch timeout
 
                 # Check if we should flush the batch
-                current_time = asyncio.get_event_loop().time()
-                should_flush_by_size = len(self.batch) >= self.batch_size
+                current_time = monotonic()
+                should_flush_by_size = self.batch_len >= self.batch_size
                 should_flush_by_time = (
                     current_time - last_flush >= self.batch_timeout
                 )
@@ -1,4 +1,6 @@
 """ClickHouse database connection management."""
+import queue
+from contextlib import contextmanager
 from typing import List, Any, Optional
 from clickhouse_driver import Client
 import logging
@@ -7,9 +9,22 @@ from backend.config import clickhouse_config
 
 logger = logging.getLogger(__name__)
 
+# Single-record inserts are batched server-side: the server buffers
+# rows and writes one part per window instead of one part per INSERT.
+_ASYNC_INSERT_SETTINGS = {
+    "async_insert": 1,
+    "wait_for_async_insert": 0,
+    "async_insert_busy_timeout_ms": 10000,
+    "async_insert_max_data_size": 10485760,
+}
+
 
 class ClickHouseConnection:
-    """Manages ClickHouse database connection."""
+    """Manages a pool of ClickHouse database connections.
+
+    A single shared Client serializes every query through one socket; a
+    small pool lets concurrent requests run queries in parallel.
+    """
 
     def __init__(
         self,
@@ -18,45 +33,109 @@ class ClickHouseConnection:
         database: str = None,
         user: str = None,
         password: str = None,
+        pool_size: int = None,
     ):
         self.host = host or clickhouse_config.HOST
         self.port = port or clickhouse_config.PORT
         self.database = database or clickhouse_config.DATABASE
         self.user = user or clickhouse_config.USER
         self.password = password or clickhouse_config.PASSWORD
-        self._client: Optional[Client] = None
+        self.pool_size = pool_size or clickhouse_config.POOL_SIZE
+        self._pool: Optional[queue.Queue] = None
+
+    def _create_client(self) -> Client:
+        return Client(
+            host=self.host,
+            port=self.port,
+            database=self.database,
+            user=self.user,
+            password=self.password,
+            # Keep long-lived connections (Airflow workers, the FastAPI
+            # pool) alive across idle gaps instead of paying a TCP
+            # handshake per task.
+            send_receive_timeout=300,
+            tcp_keepalive=(60, 30, 5),
+            settings={"insert_block_size": 1048576},
+        )
 
     def connect(self) -> None:
-        """Establish connection to ClickHouse."""
+        """Create the connection pool (clients connect lazily on first use)."""
         try:
-            self._client = Client(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.user,
-                password=self.password,
+            pool: queue.Queue = queue.Queue(maxsize=self.pool_size)
+            for _ in range(self.pool_size):
+                pool.put(self._create_client())
+            self._pool = pool
+            logger.info(
+                f"Connected to ClickHouse at {self.host}:{self.port} "
+                f"(pool size: {self.pool_size})"
             )
-            logger.info(f"Connected to ClickHouse at {self.host}:{self.port}")
         except Exception as e:
             logger.error(f"Failed to connect to ClickHouse: {e}")
             raise
 
     def disconnect(self) -> None:
-        """Close connection to ClickHouse."""
-        if self._client:
-            self._client.disconnect()
-            self._client = None
+        """Close all pooled connections to ClickHouse."""
+        if self._pool:
+            while not self._pool.empty():
+                try:
+                    self._pool.get_nowait().disconnect()
+                except queue.Empty:
+                    break
+            self._pool = None
             logger.info("Disconnected from ClickHouse")
 
+    @contextmanager
+    def _acquire(self):
+        """Borrow a client from the pool, returning it when done."""
+        if self._pool is None:
+            raise RuntimeError("Not connected to ClickHouse")
+        client = self._pool.get()
+        try:
+            yield client
+        finally:
+            self._pool.put(client)
+
     def execute(self, query: str, params: Optional[dict] = None) -> List[Any]:
         """Execute a query and return results."""
-        if not self._client:
-            raise RuntimeError("Not connected to ClickHouse")
-        return self._client.execute(query, params or {})
+        with self._acquire() as client:
+            return client.execute(query, params or {})
 
-    @property
-    def client(self) -> Client:
-        """Get underlying client for batch inserts."""
-        if not self._client:
-            raise RuntimeError("Not connected to ClickHouse")
-        return self._client
+    def execute_columnar(self, query: str, params: Optional[dict] = None) -> List[Any]:
+        """Execute a query and return results as column arrays.
+
+        Skips building one row tuple per result; callers fan the
+        columns back out only as needed.
+        """
+        with self._acquire() as client:
+            return client.execute(query, params or {}, columnar=True)
+
+    def insert(self, query: str, values: List[tuple]) -> None:
+        """Execute a batch insert."""
+        with self._acquire() as client:
+            client.execute(query, values)
+
+    def insert_async(self, query: str, values: List[tuple]) -> None:
+        """Insert via ClickHouse async_insert (fire-and-forget).
+
+        Meant for single-record writes; already-batched inserts should
+        use insert()/insert_columnar directly.
+        """
+        with self._acquire() as client:
+            client.execute(query, values, settings=_ASYNC_INSERT_SETTINGS)
+
+    def insert_columnar(self, query: str, columns: List[Any]) -> None:
+        """Execute a batch insert from column arrays.
+
+        Takes one sequence per column instead of row tuples; the driver
+        builds native blocks directly from them, skipping the per-row
+        Python loop (types_check stays off on this hot path).
+        """
+        with self._acquire() as client:
+            client.execute(query, columns, types_check=False, columnar=True)
+
+    def get_stats(self) -> dict:
+        """Pool statistics for health reporting."""
+        return {
+            "pool_size": self.pool_size,
+            "available": self._pool.qsize() if self._pool else 0,
+        }
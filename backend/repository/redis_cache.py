@@ -0,0 +1,65 @@
+"""Redis-backed read-through cache for hot API queries."""
+from typing import Optional
+import logging
+
+import redis.asyncio as redis
+
+from backend.config import redis_config
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """Thin async Redis wrapper with hit/miss counters.
+
+    Cache failures are soft: a Redis error is logged and treated as a
+    miss so the API keeps serving from ClickHouse.
+    """
+
+    def __init__(self, host: str = None, port: int = None, db: int = None):
+        self._client = redis.Redis(
+            host=host or redis_config.HOST,
+            port=port or redis_config.PORT,
+            db=db if db is not None else redis_config.DB,
+        )
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Get a cached value, counting hits and misses."""
+        try:
+            value = await self._client.get(key)
+        except Exception as e:
+            logger.debug(f"Redis get failed for {key}: {e}")
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """Set a cached value with TTL in seconds."""
+        try:
+            await self._client.set(key, value, ex=ttl)
+        except Exception as e:
+            logger.debug(f"Redis set failed for {key}: {e}")
+
+    async def invalidate_prefix(self, pattern: str) -> None:
+        """Remove all keys matching pattern (e.g. 'hist:AAPL:*')."""
+        try:
+            async for key in self._client.scan_iter(match=pattern):
+                await self._client.unlink(key)
+        except Exception as e:
+            logger.debug(f"Redis invalidation failed for {pattern}: {e}")
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        try:
+            await self._client.aclose()
+        except Exception:
+            pass
+
+    def get_stats(self) -> dict:
+        """Hit/miss counters for health reporting."""
+        return {"redis_hits": self.hits, "redis_misses": self.misses}
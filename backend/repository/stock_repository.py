@@ -5,7 +5,8 @@ import logging
 
 from backend.domain.interfaces import StockPriceRepository, HistoricalDataRepository
 from backend.domain.entities import (
-    StockPrice, HistoricalData, StockPriceCreate, HistoricalDataCreate
+    StockPriceStruct, HistoricalRowStruct, HistoricalSummaryStruct,
+    StockPriceCreate, HistoricalDataCreate,
 )
 from backend.repository.clickhouse_client import ClickHouseConnection
 
@@ -18,7 +19,7 @@ class ClickHouseStockPriceRepository(StockPriceRepository):
     def __init__(self, connection: ClickHouseConnection):
         self._conn = connection
 
-    def get_latest(self, symbol: str) -> Optional[StockPrice]:
+    def get_latest(self, symbol: str) -> Optional[StockPriceStruct]:
         """Get latest price for a symbol."""
         query = """
         SELECT timestamp, symbol, price, volume, change_percent
@@ -26,20 +27,29 @@ class ClickHouseStockPriceRepository(StockPriceRepository):
         WHERE symbol = %(symbol)s
         ORDER BY timestamp DESC
         LIMIT 1
+        SETTINGS optimize_read_in_order = 1
         """
         result = self._conn.execute(query, {"symbol": symbol})
         if result:
-            row = result[0]
-            return StockPrice(
-                timestamp=row[0],
-                symbol=row[1],
-                price=row[2],
-                volume=row[3],
-                change_percent=row[4],
-            )
+            # Struct fields follow the SELECT column order.
+            return StockPriceStruct(*result[0])
         return None
 
-    def get_history(self, symbol: str, limit: int = 100) -> List[StockPrice]:
+    def get_latest_many(self, symbols: List[str]) -> List[StockPriceStruct]:
+        """Get latest prices for several symbols in a single round-trip."""
+        if not symbols:
+            return []
+        query = """
+        SELECT max(timestamp), symbol, argMax(price, timestamp),
+               argMax(volume, timestamp), argMax(change_percent, timestamp)
+        FROM stock_prices
+        WHERE symbol IN %(symbols)s
+        GROUP BY symbol
+        """
+        results = self._conn.execute(query, {"symbols": tuple(symbols)})
+        return [StockPriceStruct(*row) for row in results]
+
+    def get_history(self, symbol: str, limit: int = 100) -> List[StockPriceStruct]:
         """Get recent price history for a symbol."""
         query = """
         SELECT timestamp, symbol, price, volume, change_percent
@@ -47,18 +57,14 @@ class ClickHouseStockPriceRepository(StockPriceRepository):
         WHERE symbol = %(symbol)s
         ORDER BY timestamp DESC
         LIMIT %(limit)s
+        SETTINGS optimize_read_in_order = 1
         """
-        results = self._conn.execute(query, {"symbol": symbol, "limit": limit})
-        return [
-            StockPrice(
-                timestamp=row[0],
-                symbol=row[1],
-                price=row[2],
-                volume=row[3],
-                change_percent=row[4],
-            )
-            for row in results
-        ]
+        columns = self._conn.execute_columnar(query, {"symbol": symbol, "limit": limit})
+        if not columns:
+            return []
+        # map() feeds one value per column to the struct without first
+        # materializing a row tuple per result.
+        return list(map(StockPriceStruct, *columns))
 
     def insert(self, record: StockPriceCreate) -> None:
         """Insert a single stock price record."""
@@ -67,7 +73,7 @@ class ClickHouseStockPriceRepository(StockPriceRepository):
         INSERT INTO stock_prices (timestamp, symbol, price, volume, change_percent)
         VALUES
         """
-        self._conn.client.execute(
+        self._conn.insert_async(
             query,
             [(timestamp, record.symbol, record.price, record.volume, record.change_percent)]
         )
@@ -80,19 +86,30 @@ class ClickHouseStockPriceRepository(StockPriceRepository):
         INSERT INTO stock_prices (timestamp, symbol, price, volume, change_percent)
         VALUES
         """
-        values = [
-            (
-                rec.timestamp or datetime.now(),
-                rec.symbol,
-                rec.price,
-                rec.volume,
-                rec.change_percent,
-            )
-            for rec in records
+        now = datetime.now()
+        # Column-oriented layout: the driver sends these as native
+        # blocks without unpacking a tuple per row.
+        columns = [
+            [rec.timestamp or now for rec in records],
+            [rec.symbol for rec in records],
+            [rec.price for rec in records],
+            [rec.volume for rec in records],
+            [rec.change_percent for rec in records],
         ]
-        self._conn.client.execute(query, values)
+        self._conn.insert_columnar(query, columns)
         logger.info(f"Inserted {len(records)} stock price records")
 
+    def insert_columns(self, columns: List[list]) -> None:
+        """Insert stock prices from column arrays (no row tuples built)."""
+        if not columns or not columns[0]:
+            return
+        query = """
+        INSERT INTO stock_prices (timestamp, symbol, price, volume, change_percent)
+        VALUES
+        """
+        self._conn.insert_columnar(query, columns)
+        logger.info(f"Inserted {len(columns[0])} stock price records")
+
 
 class ClickHouseHistoricalRepository(HistoricalDataRepository):
     """ClickHouse implementation for historical data repository."""
@@ -102,7 +119,7 @@ class ClickHouseHistoricalRepository(HistoricalDataRepository):
 
     def get_by_date_range(
         self, symbol: str, start_date: str, end_date: str
-    ) -> List[HistoricalData]:
+    ) -> List[HistoricalRowStruct]:
         """Get historical data for a symbol in date range."""
         query = """
         SELECT date, symbol, open, high, low, close, volume
@@ -112,21 +129,30 @@ class ClickHouseHistoricalRepository(HistoricalDataRepository):
           AND date <= %(end_date)s
         ORDER BY date ASC
         """
-        results = self._conn.execute(
+        columns = self._conn.execute_columnar(
             query, {"symbol": symbol, "start_date": start_date, "end_date": end_date}
         )
-        return [
-            HistoricalData(
-                date=row[0],
-                symbol=row[1],
-                open_price=row[2],
-                high=row[3],
-                low=row[4],
-                close=row[5],
-                volume=row[6],
-            )
-            for row in results
-        ]
+        if not columns:
+            return []
+        return list(map(HistoricalRowStruct, *columns))
+
+    def get_summary(
+        self, symbol: str, start_date: str, end_date: str
+    ) -> Optional[HistoricalSummaryStruct]:
+        """Get aggregated OHLC stats for the range in a single row."""
+        query = """
+        SELECT argMin(open, date), argMax(close, date), max(high), min(low), count()
+        FROM historical_data
+        WHERE symbol = %(symbol)s
+          AND date >= %(start_date)s
+          AND date <= %(end_date)s
+        """
+        result = self._conn.execute(
+            query, {"symbol": symbol, "start_date": start_date, "end_date": end_date}
+        )
+        if result and result[0][-1]:
+            return HistoricalSummaryStruct(*result[0])
+        return None
 
     def insert(self, record: HistoricalDataCreate) -> None:
         """Insert a single historical record."""
@@ -134,7 +160,7 @@ class ClickHouseHistoricalRepository(HistoricalDataRepository):
         INSERT INTO historical_data (date, symbol, open, high, low, close, volume)
         VALUES
         """
-        self._conn.client.execute(
+        self._conn.insert_async(
             query,
             [(record.date, record.symbol, record.open, record.high,
               record.low, record.close, record.volume)]
@@ -148,9 +174,14 @@ class ClickHouseHistoricalRepository(HistoricalDataRepository):
         INSERT INTO historical_data (date, symbol, open, high, low, close, volume)
         VALUES
         """
-        values = [
-            (rec.date, rec.symbol, rec.open, rec.high, rec.low, rec.close, rec.volume)
-            for rec in records
+        columns = [
+            [rec.date for rec in records],
+            [rec.symbol for rec in records],
+            [rec.open for rec in records],
+            [rec.high for rec in records],
+            [rec.low for rec in records],
+            [rec.close for rec in records],
+            [rec.volume for rec in records],
         ]
-        self._conn.client.execute(query, values)
+        self._conn.insert_columnar(query, columns)
         logger.info(f"Inserted {len(records)} historical records")
@@ -4,26 +4,32 @@ CREATE DATABASE IF NOT EXISTS breadboard;
 USE breadboard;
 
 -- Real-time stock prices table
+-- Column codecs exploit the tick shape: timestamps are near-monotonic
+-- (DoubleDelta), prices oscillate around a slow-moving value (Gorilla),
+-- volume is a positive int (T64).
 CREATE TABLE IF NOT EXISTS stock_prices (
-    timestamp DateTime,
+    timestamp DateTime CODEC(DoubleDelta, LZ4),
     symbol String,
-    price Float64,
-    volume UInt64,
-    change_percent Float64
+    price Float64 CODEC(Gorilla, LZ4),
+    volume UInt64 CODEC(T64, LZ4),
+    change_percent Float64 CODEC(Gorilla, LZ4)
 ) ENGINE = MergeTree()
+PARTITION BY toYYYYMM(timestamp)
 ORDER BY (symbol, timestamp)
 SETTINGS index_granularity = 8192;
 
 -- Historical OHLCV data table
+-- Daily bars compress well under ZSTD; dates are sequential per symbol.
 CREATE TABLE IF NOT EXISTS historical_data (
-    date Date,
+    date Date CODEC(Delta, ZSTD(1)),
     symbol String,
-    open Float64,
-    high Float64,
-    low Float64,
-    close Float64,
-    volume UInt64
+    open Float64 CODEC(Gorilla, ZSTD(1)),
+    high Float64 CODEC(Gorilla, ZSTD(1)),
+    low Float64 CODEC(Gorilla, ZSTD(1)),
+    close Float64 CODEC(Gorilla, ZSTD(1)),
+    volume UInt64 CODEC(T64, ZSTD(1))
 ) ENGINE = MergeTree()
+PARTITION BY toYYYYMM(date)
 ORDER BY (symbol, date)
 SETTINGS index_granularity = 8192;
 
@@ -1,5 +1,5 @@
 """Alert business logic."""
-from typing import Set, Callable
+from typing import Callable, List
 from datetime import datetime
 import asyncio
 import logging
@@ -14,7 +14,10 @@ class AlertService:
 
     def __init__(self, threshold: float = -5.0):
         self._threshold = threshold
-        self._callbacks: Set[Callable] = set()
+        # Split at registration so trigger_alert doesn't re-classify
+        # each callback on every alert.
+        self._sync_callbacks: List[Callable] = []
+        self._async_callbacks: List[Callable] = []
 
     @property
     def threshold(self) -> float:
@@ -22,11 +25,19 @@ class AlertService:
 
     def register_callback(self, callback: Callable) -> None:
         """Register alert callback."""
-        self._callbacks.add(callback)
+        callbacks = (
+            self._async_callbacks
+            if asyncio.iscoroutinefunction(callback)
+            else self._sync_callbacks
+        )
+        if callback not in callbacks:
+            callbacks.append(callback)
 
     def unregister_callback(self, callback: Callable) -> None:
         """Unregister alert callback."""
-        self._callbacks.discard(callback)
+        for callbacks in (self._sync_callbacks, self._async_callbacks):
+            if callback in callbacks:
+                callbacks.remove(callback)
 
     def check_alert_condition(
         self, symbol: str, price: float, change_percent: float
@@ -48,12 +59,22 @@ class AlertService:
         )
 
     async def trigger_alert(self, alert: Alert) -> None:
-        """Trigger all registered callbacks."""
-        for callback in self._callbacks:
+        """Trigger all registered callbacks.
+
+        Async callbacks run concurrently, so one slow sink delays the
+        others by nothing and the total latency is bounded by the
+        slowest callback rather than their sum.
+        """
+        for callback in self._sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(alert)
-                else:
-                    callback(alert)
+                callback(alert)
             except Exception as e:
                 logger.error(f"Error in alert callback: {e}")
+        if self._async_callbacks:
+            results = await asyncio.gather(
+                *(callback(alert) for callback in self._async_callbacks),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in alert callback: {result}")
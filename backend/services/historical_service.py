@@ -1,27 +1,111 @@
 """Historical data business logic."""
-from typing import List
+from typing import List, Optional
+import asyncio
 import logging
+import threading
+import time
+
+import msgspec
 
 from backend.domain.interfaces import HistoricalDataRepository
-from backend.domain.entities import HistoricalData, HistoricalDataCreate
+from backend.domain.entities import (
+    HistoricalRowStruct, HistoricalSummaryStruct, HistoricalDataCreate,
+)
+from backend.repository.redis_cache import RedisCache
+from backend.services.symbols import norm_symbol
 
 logger = logging.getLogger(__name__)
 
+# Historical OHLCV is immutable once the trading day closes.
+HISTORY_CACHE_TTL = 24 * 3600
+
+# Micro-batching bounds for save_historical_data: per-symbol saves from
+# a backfill coalesce into fewer, larger inserts.
+BUFFER_MAX_ROWS = 5000
+BUFFER_MAX_AGE = 1.0
+
 
 class HistoricalService:
     """Business logic for historical data operations."""
 
-    def __init__(self, repository: HistoricalDataRepository):
+    def __init__(self, repository: HistoricalDataRepository, cache: Optional[RedisCache] = None):
         self._repository = repository
+        self._cache = cache
+        self._buffer: List[HistoricalDataCreate] = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
 
-    def get_historical_data(
+    async def get_historical_data(
         self, symbol: str, start_date: str, end_date: str
-    ) -> List[HistoricalData]:
-        """Get historical OHLCV data for date range."""
-        return self._repository.get_by_date_range(
-            symbol.upper(), start_date, end_date
+    ) -> List[HistoricalRowStruct]:
+        """Get historical OHLCV data for date range.
+
+        Read-through cached in Redis; the blocking ClickHouse query runs
+        in a thread so it doesn't stall the event loop.
+        """
+        symbol = norm_symbol(symbol)
+        key = f"hist:{symbol}:{start_date}:{end_date}"
+        if self._cache:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return msgspec.json.decode(cached, type=List[HistoricalRowStruct])
+        data = await asyncio.to_thread(
+            self._repository.get_by_date_range, symbol, start_date, end_date
         )
+        if data and self._cache:
+            await self._cache.set(key, msgspec.json.encode(data), HISTORY_CACHE_TTL)
+        return data
+
+    async def get_summary(
+        self, symbol: str, start_date: str, end_date: str
+    ) -> Optional[HistoricalSummaryStruct]:
+        """Get aggregated OHLC stats for a date range.
+
+        One O(1)-sized row from ClickHouse; cached under the same hist:
+        prefix so invalidate_history covers it.
+        """
+        symbol = norm_symbol(symbol)
+        key = f"hist:{symbol}:{start_date}:{end_date}:summary"
+        if self._cache:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                return msgspec.json.decode(cached, type=HistoricalSummaryStruct)
+        summary = await asyncio.to_thread(
+            self._repository.get_summary, symbol, start_date, end_date
+        )
+        if summary and self._cache:
+            await self._cache.set(key, msgspec.json.encode(summary), HISTORY_CACHE_TTL)
+        return summary
+
+    async def invalidate_history(self, symbol: str) -> None:
+        """Drop cached history for a symbol after new data lands."""
+        if self._cache:
+            await self._cache.invalidate_prefix(f"hist:{norm_symbol(symbol)}:*")
 
     def save_historical_data(self, records: List[HistoricalDataCreate]) -> None:
-        """Save batch of historical records."""
-        self._repository.insert_batch(records)
+        """Save historical records, micro-batched.
+
+        Buffered until BUFFER_MAX_ROWS rows or BUFFER_MAX_AGE seconds;
+        callers doing a multi-symbol backfill should call flush() when
+        done to write out the tail.
+        """
+        with self._buffer_lock:
+            self._buffer.extend(records)
+            if (
+                len(self._buffer) < BUFFER_MAX_ROWS
+                and time.monotonic() - self._last_flush < BUFFER_MAX_AGE
+            ):
+                return
+            batch = self._buffer
+            self._buffer = []
+            self._last_flush = time.monotonic()
+        self._repository.insert_batch(batch)
+
+    def flush(self) -> None:
+        """Write out any buffered records (call when a backfill ends)."""
+        with self._buffer_lock:
+            batch = self._buffer
+            self._buffer = []
+            self._last_flush = time.monotonic()
+        if batch:
+            self._repository.insert_batch(batch)
@@ -1,27 +1,128 @@
 """Stock price business logic."""
 from typing import List, Optional
+import asyncio
 import logging
+import threading
+import time
+
+import msgspec
+from cachetools import TTLCache
 
 from backend.domain.interfaces import StockPriceRepository
-from backend.domain.entities import StockPrice, StockPriceCreate
+from backend.domain.entities import StockPriceStruct, StockPriceCreate
+from backend.repository.redis_cache import RedisCache
+from backend.services.symbols import norm_symbol
 
 logger = logging.getLogger(__name__)
 
+# Latest prices change every few seconds, so keep the TTL short.
+PRICE_CACHE_TTL = 5
+
+# In-process L1 in front of Redis: polling clients asking for the same
+# symbol within this window don't leave the process at all.
+LATEST_CACHE_TTL = 1.5
+LATEST_CACHE_SIZE = 1024
+
+# Micro-batching bounds for save_prices: writes are buffered until
+# either limit is hit, so per-tick callers don't pay one insert each.
+BUFFER_MAX_ROWS = 1000
+BUFFER_MAX_AGE = 0.2
+
 
 class StockService:
     """Business logic for stock price operations."""
 
-    def __init__(self, repository: StockPriceRepository):
+    def __init__(self, repository: StockPriceRepository, cache: Optional[RedisCache] = None):
         self._repository = repository
+        self._cache = cache
+        self._buffer: List[StockPriceCreate] = []
+        self._buffer_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._latest_cache: TTLCache = TTLCache(maxsize=LATEST_CACHE_SIZE, ttl=LATEST_CACHE_TTL)
+        self._latest_lock = threading.Lock()
+
+    async def get_latest_price(self, symbol: str) -> Optional[StockPriceStruct]:
+        """Get latest price for a symbol (uppercase normalized).
+
+        Read-through cached in Redis; the blocking ClickHouse query runs
+        in a thread so it doesn't stall the event loop.
+        """
+        symbol = norm_symbol(symbol)
+        with self._latest_lock:
+            price = self._latest_cache.get(symbol)
+        if price is not None:
+            return price
+        key = f"price:{symbol}"
+        if self._cache:
+            cached = await self._cache.get(key)
+            if cached is not None:
+                price = msgspec.json.decode(cached, type=StockPriceStruct)
+                with self._latest_lock:
+                    self._latest_cache[symbol] = price
+                return price
+        price = await asyncio.to_thread(self._repository.get_latest, symbol)
+        if price:
+            with self._latest_lock:
+                self._latest_cache[symbol] = price
+            if self._cache:
+                await self._cache.set(key, msgspec.json.encode(price), PRICE_CACHE_TTL)
+        return price
 
-    def get_latest_price(self, symbol: str) -> Optional[StockPrice]:
-        """Get latest price for a symbol (uppercase normalized)."""
-        return self._repository.get_latest(symbol.upper())
+    def _invalidate_latest(self, symbols) -> None:
+        """Drop L1 entries for symbols that just received new writes."""
+        with self._latest_lock:
+            for symbol in set(symbols):
+                self._latest_cache.pop(symbol, None)
 
-    def get_recent_prices(self, symbol: str, limit: int = 100) -> List[StockPrice]:
+    async def get_latest_prices(self, symbols: List[str]) -> List[StockPriceStruct]:
+        """Get latest prices for several symbols with one query."""
+        symbols = [norm_symbol(s) for s in symbols]
+        return await asyncio.to_thread(self._repository.get_latest_many, symbols)
+
+    async def get_recent_prices(self, symbol: str, limit: int = 100) -> List[StockPriceStruct]:
         """Get recent price history."""
-        return self._repository.get_history(symbol.upper(), limit)
+        return await asyncio.to_thread(self._repository.get_history, norm_symbol(symbol), limit)
 
     def save_prices(self, records: List[StockPriceCreate]) -> None:
-        """Save batch of price records."""
-        self._repository.insert_batch(records)
+        """Save price records, micro-batched.
+
+        Records accumulate in a buffer flushed at BUFFER_MAX_ROWS rows
+        or after BUFFER_MAX_AGE seconds, whichever comes first, so
+        small frequent saves coalesce into one insert.
+        """
+        with self._buffer_lock:
+            self._buffer.extend(records)
+            if (
+                len(self._buffer) < BUFFER_MAX_ROWS
+                and time.monotonic() - self._last_flush < BUFFER_MAX_AGE
+            ):
+                return
+            batch = self._buffer
+            self._buffer = []
+            self._last_flush = time.monotonic()
+        self._repository.insert_batch(batch)
+        self._invalidate_latest(rec.symbol for rec in batch)
+
+    def flush(self) -> None:
+        """Write out any buffered records (call on shutdown)."""
+        with self._buffer_lock:
+            batch = self._buffer
+            self._buffer = []
+            self._last_flush = time.monotonic()
+        if batch:
+            self._repository.insert_batch(batch)
+            self._invalidate_latest(rec.symbol for rec in batch)
+
+    def save_price_columns(self, columns: List[list]) -> None:
+        """Save a batch given as column arrays (ingest hot path)."""
+        self._repository.insert_columns(columns)
+        self._invalidate_latest(columns[1])
+
+    async def asave_price_columns(self, columns: List[list]) -> None:
+        """Save a columnar batch without blocking the event loop.
+
+        The blocking driver call runs in a thread; the connection pool
+        lets it overlap with concurrent read queries.
+        """
+        await asyncio.to_thread(self._repository.insert_columns, columns)
+        self._invalidate_latest(columns[1])
@@ -0,0 +1,9 @@
+"""Symbol normalization shared by the services."""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def norm_symbol(symbol: str) -> str:
+    """Uppercase a symbol, memoized so hot watchlist names don't
+    allocate a fresh string per request."""
+    return symbol.upper()
@@ -1,10 +1,11 @@
 import streamlit as st
 import httpx
+import orjson
 import pandas as pd
 from datetime import datetime, timedelta
 import asyncio
+import collections
 import websockets
-import json
 import logging
 import altair as alt
 
@@ -17,6 +18,14 @@ logger = logging.getLogger(__name__)
 BACKEND_URL = app_config.BACKEND_URL
 WS_URL = BACKEND_URL.replace("http://", "ws://").replace("https://", "wss://") + "/ws/realtime"
 
+# Module-level tuples so reruns don't rebuild the option lists.
+ALL_SYMBOLS = (
+    "AAPL", "BTC-USD", "NVDA", "TSLA", "META", "AMZN", "GOOGL", "MSFT",
+    "SPY", "QQQ", "ETH-USD", "SOL-USD", "AMD", "NFLX", "COIN",
+)
+DEFAULT_WATCHLIST = ("AAPL", "NVDA", "TSLA", "BTC-USD", "ETH-USD")
+HISTORY_SYMBOLS = ("AAPL", "BTC-USD", "NVDA", "TSLA", "META", "AMZN", "GOOGL", "MSFT")
+
 # Page config
 st.set_page_config(
     page_title="Breadboard - Stock Dashboard",
@@ -40,8 +49,9 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Initialize session state
+# Bounded deque: appends trim in O(1), no slicing per rerun.
 if "alerts" not in st.session_state:
-    st.session_state.alerts = []
+    st.session_state.alerts = collections.deque(maxlen=20)
 
 if "latest_prices" not in st.session_state:
     st.session_state.latest_prices = {}
@@ -49,6 +59,15 @@ if "latest_prices" not in st.session_state:
 if "prev_prices" not in st.session_state:
     st.session_state.prev_prices = {}
 
+# One pooled client per session: keep-alive connections survive reruns,
+# so each refresh skips the TCP handshake per request.
+if "http" not in st.session_state:
+    st.session_state.http = httpx.Client(
+        base_url=BACKEND_URL,
+        timeout=5.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+    )
+
 
 # Sidebar
 st.sidebar.title("📊 Breadboard")
@@ -57,44 +76,67 @@ st.sidebar.markdown("Real-time Stock Dashboard")
 page = st.sidebar.radio("Navigation", ["📈 Real-time Monitor", "📊 Historical Analysis", "🔔 Alerts"])
 
 
-def fetch_latest_price(symbol: str):
-    """Fetch latest price for a symbol from API."""
+@st.cache_data(ttl=2, show_spinner=False)
+def fetch_watchlist_prices(symbols):
+    """Fetch latest prices for the whole watchlist in one request.
+
+    The backend answers with a single batched query, so refresh cost is
+    one round-trip regardless of watchlist size.
+    """
     try:
-        response = httpx.get(f"{BACKEND_URL}/api/v1/stocks/{symbol}", timeout=5.0)
+        response = st.session_state.http.get(
+            "/api/v1/stocks", params={"symbols": ",".join(symbols)}
+        )
         if response.status_code == 200:
-            return response.json()
-        return None
+            return orjson.loads(response.content)
     except Exception as e:
-        logger.error(f"Error fetching price for {symbol}: {e}")
-        return None
+        logger.error(f"Error fetching watchlist prices: {e}")
+    return {}
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def fetch_historical_data(symbol: str, start_date: str, end_date: str):
     """Fetch historical data from API."""
     try:
-        response = httpx.get(
-            f"{BACKEND_URL}/api/v1/history",
+        response = st.session_state.http.get(
+            "/api/v1/history",
             params={"symbol": symbol, "start": start_date, "end": end_date},
             timeout=10.0
         )
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return None
     except Exception as e:
         logger.error(f"Error fetching historical data: {e}")
         return None
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def fetch_history_summary(symbol: str, start_date: str, end_date: str):
+    """Fetch aggregated OHLC stats; ClickHouse computes them in one row."""
+    try:
+        response = st.session_state.http.get(
+            "/api/v1/history/summary",
+            params={"symbol": symbol, "start": start_date, "end": end_date},
+        )
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+        return None
+    except Exception as e:
+        logger.error(f"Error fetching history summary: {e}")
+        return None
+
+
+@st.cache_data(ttl=2, show_spinner=False)
 def fetch_recent_prices(symbol: str, limit: int = 100):
     """Fetch recent price history for a symbol."""
     try:
-        response = httpx.get(
-            f"{BACKEND_URL}/api/v1/stocks/{symbol}/recent",
-            params={"limit": limit},
-            timeout=5.0
+        response = st.session_state.http.get(
+            f"/api/v1/stocks/{symbol}/recent",
+            params={"limit": limit, "order": "asc"},
         )
         if response.status_code == 200:
-            return response.json()
+            return orjson.loads(response.content)
         return None
     except Exception as e:
         logger.error(f"Error fetching recent prices: {e}")
@@ -130,22 +172,24 @@ if page == "📈 Real-time Monitor":
 
     # Watchlist
     st.sidebar.markdown("### Watchlist")
-    default_symbols = ["AAPL", "NVDA", "TSLA", "BTC-USD", "ETH-USD"]
     watchlist = st.sidebar.multiselect(
         "Select symbols to watch",
-        ["AAPL", "BTC-USD", "NVDA", "TSLA", "META", "AMZN", "GOOGL", "MSFT", "SPY", "QQQ", "ETH-USD", "SOL-USD", "AMD", "NFLX", "COIN"],
-        default=default_symbols
+        ALL_SYMBOLS,
+        default=DEFAULT_WATCHLIST
     )
 
-    # Create columns for metrics
-    if watchlist:
-        cols = st.columns(min(len(watchlist), 5))
+    # Fragments repaint on their own cadence, so a refresh re-renders
+    # only the price tiles and chart instead of rerunning the whole page.
+    @st.fragment(run_every="5s")
+    def render_watchlist(symbols):
+        cols = st.columns(min(len(symbols), 5))
 
-        for idx, symbol in enumerate(watchlist):
-            col = cols[idx % 5]
+        # Fetch the whole watchlist in one batched request
+        price_map = fetch_watchlist_prices(symbols)
 
-            # Fetch latest price
-            price_data = fetch_latest_price(symbol)
+        for idx, symbol in enumerate(symbols):
+            col = cols[idx % 5]
+            price_data = price_map.get(symbol)
 
             if price_data:
                 with col:
@@ -153,6 +197,40 @@ if page == "📈 Real-time Monitor":
                     price = price_data.get("price", 0.0)
                     render_price_metric(symbol, price, change_percent)
 
+    @st.fragment(run_every="5s")
+    def render_price_chart(symbol):
+        recent_data = fetch_recent_prices(symbol, limit=100)
+
+        if recent_data and recent_data.get("records"):
+            # Rows arrive oldest-first from the backend, so no sort pass;
+            # ISO8601 + cache hits pandas' C parse path and dedupes
+            # repeated timestamps.
+            df = pd.DataFrame.from_records(recent_data["records"])
+            df["timestamp"] = pd.to_datetime(df["timestamp"], format="ISO8601", cache=True)
+
+            # Dynamic Y-axis with Altair
+            y_min = df["price"].min() * 0.995
+            y_max = df["price"].max() * 1.005
+
+            chart = alt.Chart(df).mark_line().encode(
+                x=alt.X('timestamp:T', title='Time'),
+                y=alt.Y('price:Q',
+                        title='Price ($)',
+                        scale=alt.Scale(domain=[y_min, y_max]))
+            ).properties(
+                height=400,
+                title=f"{symbol} Price History"
+            ).interactive()
+
+            st.altair_chart(chart, use_container_width=True)
+
+            # Show data table
+            with st.expander("View Data Table"):
+                st.dataframe(df[["timestamp", "price", "volume", "change_percent"]])
+
+    if watchlist:
+        render_watchlist(watchlist)
+
         st.markdown("---")
 
         # Price chart for selected symbol
@@ -160,41 +238,7 @@ if page == "📈 Real-time Monitor":
         selected_symbol = st.selectbox("Select symbol for chart", watchlist)
 
         if selected_symbol:
-            recent_data = fetch_recent_prices(selected_symbol, limit=100)
-
-            if recent_data and recent_data.get("records"):
-                df = pd.DataFrame(recent_data["records"])
-                df["timestamp"] = pd.to_datetime(df["timestamp"])
-                df = df.sort_values("timestamp")
-
-                # Dynamic Y-axis with Altair
-                y_min = df["price"].min() * 0.995
-                y_max = df["price"].max() * 1.005
-
-                chart = alt.Chart(df).mark_line().encode(
-                    x=alt.X('timestamp:T', title='Time'),
-                    y=alt.Y('price:Q',
-                            title='Price ($)',
-                            scale=alt.Scale(domain=[y_min, y_max]))
-                ).properties(
-                    height=400,
-                    title=f"{selected_symbol} Price History"
-                ).interactive()
-
-                st.altair_chart(chart, use_container_width=True)
-
-                # Show data table
-                with st.expander("View Data Table"):
-                    st.dataframe(df[["timestamp", "price", "volume", "change_percent"]])
-
-        # Auto-refresh
-        st.sidebar.markdown("---")
-        auto_refresh = st.sidebar.checkbox("Auto-refresh (every 5s)", value=True)
-
-        if auto_refresh:
-            import time
-            time.sleep(5)
-            st.rerun()
+            render_price_chart(selected_symbol)
 
 
 # Page: Historical Analysis
@@ -205,10 +249,7 @@ elif page == "📊 Historical Analysis":
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        symbol = st.selectbox(
-            "Symbol",
-            ["AAPL", "BTC-USD", "NVDA", "TSLA", "META", "AMZN", "GOOGL", "MSFT"]
-        )
+        symbol = st.selectbox("Symbol", HISTORY_SYMBOLS)
 
     with col2:
         start_date = st.date_input(
@@ -230,23 +271,30 @@ elif page == "📊 Historical Analysis":
                 end_date.strftime("%Y-%m-%d")
             )
 
+            summary = fetch_history_summary(
+                symbol,
+                start_date.strftime("%Y-%m-%d"),
+                end_date.strftime("%Y-%m-%d")
+            )
+
             if data and data.get("records"):
-                df = pd.DataFrame(data["records"])
+                df = pd.DataFrame.from_records(data["records"])
 
                 st.success(f"Fetched {len(df)} trading days")
 
-                # Summary statistics
-                st.subheader("Summary Statistics")
-                col1, col2, col3, col4 = st.columns(4)
+                # Summary statistics (aggregated server-side)
+                if summary:
+                    st.subheader("Summary Statistics")
+                    col1, col2, col3, col4 = st.columns(4)
 
-                with col1:
-                    st.metric("Open", f"${df.iloc[0]['open']:.2f}")
-                with col2:
-                    st.metric("Close", f"${df.iloc[-1]['close']:.2f}")
-                with col3:
-                    st.metric("High", f"${df['high'].max():.2f}")
-                with col4:
-                    st.metric("Low", f"${df['low'].min():.2f}")
+                    with col1:
+                        st.metric("Open", f"${summary['open']:.2f}")
+                    with col2:
+                        st.metric("Close", f"${summary['close']:.2f}")
+                    with col3:
+                        st.metric("High", f"${summary['high']:.2f}")
+                    with col4:
+                        st.metric("Low", f"${summary['low']:.2f}")
 
                 # OHLC Chart
                 st.subheader("Price Chart")
@@ -272,19 +320,22 @@ elif page == "🔔 Alerts":
 
     st.markdown("### Recent Alerts")
 
-    if st.session_state.alerts:
-        for alert in reversed(st.session_state.alerts[-20:]):
-            alert_type = alert.get("type", "unknown")
-            symbol = alert["data"].get("symbol", "N/A")
-            change_percent = alert["data"].get("change_percent", 0.0)
-            price = alert["data"].get("price", 0.0)
-            timestamp = alert["data"].get("timestamp", "")
+    @st.fragment(run_every="2s")
+    def render_alerts():
+        if st.session_state.alerts:
+            for alert in reversed(st.session_state.alerts):
+                symbol = alert["data"].get("symbol", "N/A")
+                change_percent = alert["data"].get("change_percent", 0.0)
+                price = alert["data"].get("price", 0.0)
+                timestamp = alert["data"].get("timestamp", "")
 
-            st.warning(
-                f"**{symbol}** dropped {change_percent:.2f}% to ${price:.2f} at {timestamp}"
-            )
-    else:
-        st.info("No alerts yet. Alerts will appear here when price drops >= 5%.")
+                st.warning(
+                    f"**{symbol}** dropped {change_percent:.2f}% to ${price:.2f} at {timestamp}"
+                )
+        else:
+            st.info("No alerts yet. Alerts will appear here when price drops >= 5%.")
+
+    render_alerts()
 
     # Alert configuration
     st.markdown("---")
@@ -294,17 +345,29 @@ elif page == "🔔 Alerts":
     st.markdown("Alerts are automatically triggered when any symbol drops 5% or more.")
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def get_health():
+    """Fetch /health at most once per TTL window.
+
+    Failures are cached as None too, so a down backend doesn't get
+    hammered with a retry on every rerun.
+    """
+    try:
+        response = st.session_state.http.get("/health", timeout=2.0)
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+    except Exception:
+        pass
+    return None
+
+
 # Footer
 st.sidebar.markdown("---")
 st.sidebar.markdown("**Status**")
-try:
-    response = httpx.get(f"{BACKEND_URL}/health", timeout=5.0)
-    if response.status_code == 200:
-        health = response.json()
-        st.sidebar.success("✅ Backend Online")
-        st.sidebar.caption(f"Queue: {health.get('queue_size', 0)} msgs")
-        st.sidebar.caption(f"WS Clients: {health.get('websocket_clients', 0)}")
-    else:
-        st.sidebar.error("❌ Backend Offline")
-except Exception:
+health = get_health()
+if health is not None:
+    st.sidebar.success("✅ Backend Online")
+    st.sidebar.caption(f"Queue: {health.get('queue_size', 0)} msgs")
+    st.sidebar.caption(f"WS Clients: {health.get('websocket_clients', 0)}")
+else:
     st.sidebar.error("❌ Backend Unreachable")
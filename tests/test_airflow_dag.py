@@ -1,6 +1,6 @@
 """Tests for Airflow DAG."""
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 
 
 def test_dag_imports():
@@ -55,8 +55,9 @@ def test_fetch_all_symbols_success(mock_service, mock_yahoo):
         "record_count": 1,
     }
 
-    # Mock service
+    # Mock service (cache invalidation is async)
     mock_service_instance = MagicMock()
+    mock_service_instance.invalidate_history = AsyncMock()
     mock_service.return_value = mock_service_instance
 
     # Test with small symbol list
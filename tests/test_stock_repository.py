@@ -0,0 +1,50 @@
+"""Tests for ClickHouse repository result-to-struct mapping.
+
+The structs are built positionally, so these guard that struct field
+order stays in sync with the SELECT column order.
+"""
+from datetime import datetime, date
+from unittest.mock import MagicMock
+
+from backend.repository.stock_repository import (
+    ClickHouseStockPriceRepository,
+    ClickHouseHistoricalRepository,
+)
+
+
+def test_get_latest_field_types():
+    """Row tuples map positionally into StockPriceStruct fields."""
+    conn = MagicMock()
+    conn.execute.return_value = [
+        (datetime(2024, 1, 1, 12, 0, 0), "AAPL", 185.5, 1000, -1.2),
+    ]
+    repo = ClickHouseStockPriceRepository(conn)
+
+    price = repo.get_latest("AAPL")
+
+    assert isinstance(price.timestamp, datetime)
+    assert price.symbol == "AAPL"
+    assert isinstance(price.price, float)
+    assert isinstance(price.volume, int)
+    assert isinstance(price.change_percent, float)
+
+
+def test_get_by_date_range_field_types():
+    """Columnar results map one column per HistoricalRowStruct field."""
+    conn = MagicMock()
+    conn.execute_columnar.return_value = [
+        [date(2024, 1, 1)], ["AAPL"], [100.0], [105.0], [99.0], [102.0], [1000000],
+    ]
+    repo = ClickHouseHistoricalRepository(conn)
+
+    records = repo.get_by_date_range("AAPL", "2024-01-01", "2024-01-02")
+
+    assert len(records) == 1
+    rec = records[0]
+    assert isinstance(rec.date, date)
+    assert rec.symbol == "AAPL"
+    assert rec.open == 100.0
+    assert rec.high == 105.0
+    assert rec.low == 99.0
+    assert rec.close == 102.0
+    assert rec.volume == 1000000